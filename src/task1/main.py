@@ -1,56 +1,100 @@
 """File for main method"""
-import mysql.connector
+from mysql.connector import HAVE_CEXT
+from mysql.connector.pooling import MySQLConnectionPool
 
+_HOST = "localhost"
+_PORT = 3306
+_USER = "root"
+_DB_PASSWD = "dev-instance"
 
-def main():
-    cnx = mysql.connector(
-            host="localhost",
-            port=3306,
-            user="root",
-            password="dev-instance"
+_server_pool: MySQLConnectionPool | None = None
+
+# USE leaves python_db selected on the connection after it is returned to the
+# pool (a session reset keeps the default database), so later borrowers must
+# not assume that no database is selected.
+_Q_INIT_SCHEMA = """CREATE DATABASE IF NOT EXISTS python_db;
+    USE python_db;
+
+    CREATE TABLE IF NOT EXISTS mysqli_users (
+        ID INT AUTO_INCREMENT PRIMARY KEY,
+        User VARCHAR(80) NOT NULL,
+        Password VARCHAR(255) NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS mysqli_logs (
+        log_id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT,
+        action_type ENUM('INSERT', 'UPDATE', 'DELETE'),
+        action_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    DROP TRIGGER IF EXISTS after_user_insert;
+    CREATE TRIGGER after_user_insert
+    AFTER INSERT ON mysqli_users
+    FOR EACH ROW
+    BEGIN
+        INSERT INTO mysqli_logs (user_id, action_type)
+        VALUES (NEW.id, 'INSERT');
+    END;
+
+    DROP TRIGGER IF EXISTS after_user_update;
+    CREATE TRIGGER after_user_update
+    AFTER UPDATE ON mysqli_users
+    FOR EACH ROW
+    BEGIN
+        INSERT INTO mysqli_logs (user_id, action_type)
+        VALUES (NEW.id, 'UPDATE');
+    END;
+
+    DROP TRIGGER IF EXISTS after_user_delete;
+    CREATE TRIGGER after_user_delete
+    AFTER DELETE ON mysqli_users
+    FOR EACH ROW
+    BEGIN
+        INSERT INTO mysqli_logs (user_id, action_type)
+        VALUES (OLD.id, 'DELETE');
+    END;"""
+
+
+def _get_connection():
+    """Returns a connection from the process-wide pool, creating the pool on first use."""
+    global _server_pool
+    if _server_pool is None:
+        _server_pool = MySQLConnectionPool(
+            pool_name="srv",
+            # Only initialize_schema() borrows a connection, one at a time.
+            pool_size=1,
+            host=_HOST,
+            port=_PORT,
+            user=_USER,
+            password=_DB_PASSWD,
+            autocommit=True,
+            # Prefer the C extension for protocol parsing, fall back to pure Python.
+            use_pure=not HAVE_CEXT
         )
-        
-    cursor: cnx.cursor()
-
-    query_dict: dict[str, str] = {
-        "create_db_query": "CREATE DATABASE python_db;",
-        "create_table_query": """CREATE TABLE mysqli_logs (
-            log_id INT AUTO_INCREMENT PRIMARY KEY,
-            user_id INT,
-            action_type ENUM('INSERT', 'UPDATE', 'DELETE'),
-            action_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );""",
-        "create_triggers_query": """CREATE TRIGGER after_user_insert
-        AFTER INSERT ON mysqli_users
-        FOR EACH ROW
-        BEGIN
-            INSERT INTO mysqli_logs (user_id, action_type)
-            VALUES (NEW.id, 'INSERT');
-        END;
-
-        CREATE TRIGGER after_user_update
-        AFTER UPDATE ON mysqli_users
-        FOR EACH ROW
-        BEGIN
-            INSERT INTO mysqli_logs (user_id, action_type)
-            VALUES (NEW.id, 'UPDATE');
-        END;
-
-        CREATE TRIGGER after_user_delete
-        AFTER DELETE ON mysqli_users
-        FOR EACH ROW
-        BEGIN
-            INSERT INTO mysqli_logs (user_id, action_type)
-            VALUES (OLD.id, 'DELETE');
-        END;"""
-    }
-
-    for key, query in query_dict.items():
-        print("Executing query: ", key)
-        cursor.execute(query)
-    
-    cnx.close()
-    
+    return _server_pool.get_connection()
+
+
+def initialize_schema():
+    """Creates the database, tables and triggers in a single round trip."""
+    cnx = _get_connection()
+
+    print("Initializing schema")
+    try:
+        cursor = cnx.cursor()
+        try:
+            # The whole script travels in one round trip; results must be drained.
+            cursor.execute(_Q_INIT_SCHEMA)
+            while cursor.nextset():
+                pass
+        finally:
+            cursor.close()
+    finally:
+        cnx.close()
+
+
+def main():
+    initialize_schema()
 
 
 if __name__ == "__main__":